@@ -1,6 +1,7 @@
 """ActronAir Neo API"""
 
 import asyncio
+import hashlib
 import json
 import logging
 from typing import Dict, Any, List
@@ -8,8 +9,9 @@ from datetime import datetime, timedelta
 import os
 import aiohttp # type: ignore
 import aiofiles # type: ignore
+from homeassistant.util.json import json_loads # type: ignore
 
-from .const import API_URL, API_TIMEOUT, MAX_RETRIES, MAX_REQUESTS_PER_MINUTE
+from .const import API_URL, API_TIMEOUT, MAX_RETRIES, MAX_REQUESTS_PER_MINUTE, VALID_FAN_MODES
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,6 +93,7 @@ class ActronApi:
         self.error_count: int = 0
         self.last_successful_request: datetime | None = None
         self.cached_status: dict | None = None
+        self.cached_status_digest: bytes | None = None
         
         # Rate limiting
         self.rate_limiter = RateLimiter(MAX_REQUESTS_PER_MINUTE)
@@ -119,10 +122,9 @@ class ActronApi:
         base_mode = mode.split('-')[0] if '-' in mode else mode
         base_mode = base_mode.split('+')[0] if '+' in mode else base_mode
         
-        valid_modes = ["LOW", "MED", "HIGH", "AUTO"]
         base_mode = base_mode.upper()
         
-        if base_mode not in valid_modes:
+        if base_mode not in VALID_FAN_MODES:
             _LOGGER.warning(f"Invalid fan mode {mode}, defaulting to LOW")
             base_mode = "LOW"
                 
@@ -261,6 +263,11 @@ class ActronApi:
 
     async def _make_request(self, method: str, url: str, auth_required: bool = True, **kwargs) -> Dict[str, Any]:
         """Make an API request with rate limiting and error handling."""
+        _, response = await self._make_raw_request(method, url, auth_required, **kwargs)
+        return response
+
+    async def _make_raw_request(self, method: str, url: str, auth_required: bool = True, **kwargs) -> tuple[bytes, Any]:
+        """Make an API request and return the raw response body with its decoded form."""
         async with self.rate_limiter:
             for attempt in range(MAX_RETRIES):
                 try:
@@ -277,23 +284,27 @@ class ActronApi:
                         _LOGGER.debug("Request payload:\n%s", json.dumps(kwargs['json'], indent=2))
 
                     async with self.session.request(method, url, timeout=API_TIMEOUT, **kwargs) as response:
-                        response_text = await response.text()
+                        response_body = await response.read()
                         _LOGGER.debug("Response status: %s", response.status)
                         try:
-                            response_json = json.loads(response_text)
-                            _LOGGER.debug("Response body:\n%s", json.dumps(response_json, indent=2))
+                            # Decode straight from bytes with orjson (via HA's json helper)
+                            response_json = json_loads(response_body)
+                            if _LOGGER.isEnabledFor(logging.DEBUG):
+                                _LOGGER.debug("Response body:\n%s", json.dumps(response_json, indent=2))
                         except json.JSONDecodeError:
+                            response_text = response_body.decode(errors="replace")
                             _LOGGER.debug("Non-JSON response body:\n%s", response_text)
 
                         if response.status == 200:
                             self.error_count = 0
                             self.last_successful_request = datetime.now()
-                            return response_json if 'response_json' in locals() else response_text
+                            return response_body, response_json if 'response_json' in locals() else response_text
                         elif response.status == 401 and auth_required:
                             _LOGGER.warning("Token expired, refreshing...")
                             await self.refresh_access_token()
                             continue
                         else:
+                            response_text = response_body.decode(errors="replace")
                             _LOGGER.error("API request failed: %s, %s", response.status, response_text)
                             self.error_count += 1
                             raise ApiError(f"API request failed: {response.status}, {response_text}", status_code=response.status)
@@ -331,18 +342,25 @@ class ActronApi:
         _LOGGER.debug("Found devices: %s", devices)
         return devices
 
-    async def get_ac_status(self, serial: str) -> Dict[str, Any]:
-        """Get the current status of the AC system."""
+    async def get_ac_status(self, serial: str) -> tuple[Dict[str, Any], bytes | None]:
+        """Get the current status of the AC system and a digest of its raw body.
+
+        The digest lets callers detect an unchanged payload without comparing
+        parsed data. When the API is unhealthy the cached status is returned
+        with the digest it was fetched with.
+        """
         if not self.is_api_healthy():
             _LOGGER.warning("API is not healthy, using cached status")
-            return self.cached_status if self.cached_status else {}
+            return (self.cached_status if self.cached_status else {}), self.cached_status_digest
 
         url = f"{API_URL}/api/v0/client/ac-systems/status/latest?serial={serial}"
         _LOGGER.debug("Fetching AC status from: %s", url)
-        response = await self._make_request("GET", url)
+        response_body, response = await self._make_raw_request("GET", url)
         _LOGGER.debug("AC status response: %s", response)
+        digest = hashlib.blake2b(response_body, digest_size=8).digest()
         self.cached_status = response
-        return response
+        self.cached_status_digest = digest
+        return response, digest
 
     async def send_command(self, serial: str, command: Dict[str, Any]) -> Dict[str, Any]:
         """Send a command to the AC system."""
@@ -370,24 +388,6 @@ class ActronApi:
 
         raise ApiError(f"Failed to send command after {MAX_RETRIES} attempts")
 
-    async def get_zone_statuses(self) -> List[bool]:
-        """Get the current status of all zones."""
-        status = await self.get_ac_status(self.actron_serial)
-        return status['lastKnownState']['UserAirconSettings']['EnabledZones']
-
-    async def set_zone_state(self, zone_index: int, enable: bool) -> None:
-        """Set the state of a specific zone."""
-        current_zone_status = await self.get_zone_statuses()
-        modified_statuses = current_zone_status.copy()
-        modified_statuses[zone_index] = enable
-        command = self.create_command("SET_ZONE_STATE", zones=modified_statuses)
-        await self.send_command(self.actron_serial, command)
-
-    async def set_zone_temperature(self, zone_index: int, temperature: float, is_cooling: bool) -> None:
-        """Set the temperature for a specific zone."""
-        command = self.create_command("SET_ZONE_TEMP", zone=zone_index, temp=temperature, is_cool=is_cooling)
-        await self.send_command(self.actron_serial, command)
-
     async def initializer(self):
         """Initialize the ActronApi by loading tokens and authenticating."""
         _LOGGER.debug("Initializing ActronApi")
@@ -476,11 +476,6 @@ class ActronApi:
         }
         return commands[command_type](**params)
 
-    async def set_climate_mode(self, mode: str) -> None:
-        """Set the climate mode."""
-        command = self.create_command("CLIMATE_MODE", mode=mode)
-        await self.send_command(self.actron_serial, command)
-
     async def set_fan_mode(self, mode: str, continuous: bool | None = None) -> None:
         """Set fan mode with state tracking, validation and retry logic.
         
@@ -496,8 +491,7 @@ class ActronApi:
         try:
             # If continuous is not specified, maintain current state
             if continuous is None:
-                current_mode = self.data["main"].get("fan_mode", "")
-                continuous = current_mode.endswith("+CONT")
+                continuous = self._continuous_fan
                 _LOGGER.debug("Maintaining current continuous state: %s", continuous)
             
             # Rate limiting check
@@ -548,11 +542,6 @@ class ActronApi:
                         mode, continuous, err, exc_info=True)
             raise
 
-    async def set_temperature(self, temperature: float, is_cooling: bool) -> None:
-        """Set the temperature."""
-        command = self.create_command("SET_TEMP", temp=temperature, is_cool=is_cooling)
-        await self.send_command(self.actron_serial, command)
-
     async def set_away_mode(self, state: bool) -> None:
         """Set away mode."""
         command = self.create_command("AWAY_MODE", state=state)
@@ -139,13 +139,9 @@ class ActronClimate(CoordinatorEntity, ClimateEntity):
             return  # No change needed
 
         if hvac_mode == HVACMode.OFF:
-            command = self.coordinator.api.create_command("OFF")
+            await self.coordinator.set_hvac_mode(HVACMode.OFF)
         else:
-            actron_mode = self._ha_to_actron_hvac_mode(hvac_mode)
-            command = self.coordinator.api.create_command("CLIMATE_MODE", mode=actron_mode)
-
-        await self.coordinator.api.send_command(self.coordinator.device_id, command)
-        await self.coordinator.async_request_refresh()
+            await self.coordinator.set_hvac_mode(self._ha_to_actron_hvac_mode(hvac_mode))
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set new target fan mode."""
@@ -169,9 +165,7 @@ class ActronClimate(CoordinatorEntity, ClimateEntity):
         if self.hvac_mode == HVACMode.OFF:
             return  # Already off
 
-        command = self.coordinator.api.create_command("OFF")
-        await self.coordinator.api.send_command(self.coordinator.device_id, command)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.set_hvac_mode(HVACMode.OFF)
 
     def _actron_to_ha_hvac_mode(self, mode: str) -> HVACMode:
         """Convert Actron HVAC mode to HA HVAC mode."""
@@ -226,7 +220,7 @@ class ActronZoneClimate(CoordinatorEntity, ClimateEntity):
 
         # Get zone info from RemoteZoneInfo array to check capabilities
         zone_info = next(
-            (zone for zone in coordinator.data["raw_data"].get("lastKnownState", {})
+            (zone for zone in (coordinator.api.cached_status or {}).get("lastKnownState", {})
             .get(f"<{coordinator.device_id.upper()}>", {}).get("RemoteZoneInfo", [])
             if zone.get("NV_Title") == coordinator.data['zones'][zone_id]['name']),
             {}
@@ -332,7 +326,7 @@ class ActronZoneClimate(CoordinatorEntity, ClimateEntity):
             else:
                 await self.coordinator.set_zone_state(self.zone_id, True)
                 actron_mode = self._ha_to_actron_hvac_mode(hvac_mode)
-                await self.coordinator.set_climate_mode(actron_mode)
+                await self.coordinator.set_hvac_mode(actron_mode)
 
             self._attr_hvac_mode = hvac_mode
             self.async_write_ha_state()
@@ -29,6 +29,8 @@ HVAC_MODE_AUTO = "AUTO"
 FAN_LOW = "LOW"
 FAN_MEDIUM = "MED"
 FAN_HIGH = "HIGH"
+FAN_AUTO = "AUTO"
+VALID_FAN_MODES = frozenset((FAN_LOW, FAN_MEDIUM, FAN_HIGH, FAN_AUTO))
 
 # Temperature limits
 MIN_TEMP = 10
@@ -67,6 +69,7 @@ ATTR_ZONE_TEMP = "zone_temperature"
 ATTR_ZONE_HUMIDITY = "zone_humidity"
 ATTR_ZONE_NAME = "zone_name"
 ATTR_ZONE_ENABLED = "zone_enabled"
+ZONE_STATE_BATCH_DELAY = 0.15  # seconds to coalesce zone toggles into one command
 
 # System modes
 MODE_COOL = "COOL"
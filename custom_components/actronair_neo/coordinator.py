@@ -2,21 +2,66 @@
 
 from datetime import timedelta
 from typing import Any, Dict, Optional, Union
+import asyncio
 import logging
 
-from homeassistant.core import HomeAssistant # type: ignore
+from homeassistant.core import HomeAssistant, callback # type: ignore
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed # type: ignore
 from homeassistant.exceptions import ConfigEntryAuthFailed # type: ignore
 from homeassistant.components.climate.const import HVACMode # type: ignore
 
 from .api import ActronApi, AuthenticationError, ApiError
-from .const import DOMAIN, MAX_ZONES
+from .const import DOMAIN, MAX_ZONES, VALID_FAN_MODES, ZONE_STATE_BATCH_DELAY
 
 _LOGGER = logging.getLogger(__name__)
 
+# (output key, path within lastKnownState, default) for the flat "main" values
+_MAIN_FIELDS = (
+    ("is_on", ("UserAirconSettings", "isOn"), False),
+    ("mode", ("UserAirconSettings", "Mode"), "OFF"),
+    ("temp_setpoint_cool", ("UserAirconSettings", "TemperatureSetpoint_Cool_oC"), None),
+    ("temp_setpoint_heat", ("UserAirconSettings", "TemperatureSetpoint_Heat_oC"), None),
+    ("indoor_temp", ("MasterInfo", "LiveTemp_oC"), None),
+    ("indoor_humidity", ("MasterInfo", "LiveHumidity_pc"), None),
+    ("compressor_state", ("LiveAircon", "CompressorMode"), "OFF"),
+    ("EnabledZones", ("UserAirconSettings", "EnabledZones"), ()),
+    ("away_mode", ("UserAirconSettings", "AwayMode"), False),
+    ("quiet_mode", ("UserAirconSettings", "QuietMode"), False),
+    ("model", ("AirconSystem", "MasterWCModel"), None),
+    ("serial_number", ("AirconSystem", "MasterSerial"), None),
+    ("firmware_version", ("AirconSystem", "MasterWCFirmwareVersion"), None),
+    # Alert statuses
+    ("filter_clean_required", ("Alerts", "CleanFilter"), False),
+    ("defrosting", ("Alerts", "Defrosting"), False),
+)
+
+def _extract(root: Dict[str, Any], path: tuple, default: Any) -> Any:
+    """Walk a nested dict along path, returning default on the first missing key."""
+    node = root
+    for key in path:
+        node = node.get(key)
+        if node is None:
+            return default
+    return node
+
 class ActronDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ActronAir Neo data."""
 
+    __slots__ = (
+        "api",
+        "device_id",
+        "enable_zone_control",
+        "last_data",
+        "_last_status_digest",
+        "_local_state_version",
+        "_continuous_fan",
+        "_peripherals_by_zone",
+        "_zone_index_map",
+        "_pending_zones",
+        "_zone_flush_task",
+        "_zone_flush_lock",
+    )
+
     def __init__(self, hass: HomeAssistant, api: ActronApi, device_id: str, update_interval: int, enable_zone_control: bool):
         """Initialize the data coordinator.
         
@@ -37,7 +82,15 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         self.device_id = device_id
         self.enable_zone_control = enable_zone_control
         self.last_data = None
+        self._last_status_digest: Optional[bytes] = None
+        self._local_state_version = 0
         self._continuous_fan = False
+        self._peripherals_by_zone: Dict[int, Dict[str, Any]] = {}
+        self._zone_index_map: Dict[str, int] = {}
+        self._pending_zones: Dict[int, bool] = {}
+        self._zone_flush_task: Optional[asyncio.Task] = None
+        self._zone_flush_lock = asyncio.Lock()
+        self._specialize_for_zone_control()
 
     @property
     def continuous_fan(self) -> bool:
@@ -52,8 +105,40 @@ class ActronDataCoordinator(DataUpdateCoordinator):
     async def set_enable_zone_control(self, enable: bool):
         """Update the enable_zone_control status."""
         self.enable_zone_control = enable
+        self._specialize_for_zone_control()
         await self.async_request_refresh()
 
+    def _specialize_for_zone_control(self) -> None:
+        """Switch to the coordinator variant matching the zone control setting.
+
+        With zone control disabled, zone commands are rejected by the class
+        itself rather than by a flag check on every call.
+        """
+        self.__class__ = ActronDataCoordinator if self.enable_zone_control else _ActronDataCoordinatorNoZoneControl
+
+    def _zone_index(self, zone_id: Union[str, int]) -> Optional[int]:
+        """Return the zero-based index for a zone ID string or direct zone index.
+
+        Returns None for zone ID strings not seen in the last parsed data.
+        """
+        if not isinstance(zone_id, str):
+            return int(zone_id)
+        return self._zone_index_map.get(zone_id)
+
+    @callback
+    def _async_apply_local_state(self, **changes: Any) -> None:
+        """Apply an accepted command to the cached main state and notify entities.
+
+        The next scheduled poll reconciles this with the reported device state.
+        """
+        if not self.data:
+            return
+        self.data["main"].update(changes)
+        # Force the next poll to re-parse even if the payload is unchanged
+        self._last_status_digest = None
+        self._local_state_version += 1
+        self.async_update_listeners()
+
     async def _async_update_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint."""
         try:
@@ -62,10 +147,37 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                 return self.last_data if self.last_data else {}
 
             _LOGGER.debug("Fetching data for device %s", self.device_id)
-            status = await self.api.get_ac_status(self.device_id)
-            parsed_data = self._parse_data(status)
+            local_state_version = self._local_state_version
+            status, status_digest = await self.api.get_ac_status(self.device_id)
+            if self.last_data and status_digest == self._last_status_digest:
+                _LOGGER.debug("Status unchanged since last update, reusing parsed data")
+                return self.last_data
+
+            # Parse in the executor so large payloads do not hold up the event loop
+            parsed_data, peripherals_by_zone, zone_index_map = await self.hass.async_add_executor_job(
+                self._parse_data, status
+            )
+
+            # A command applied locally meanwhile is newer than this payload;
+            # keep it, and the cleared digest makes the next poll re-parse
+            if local_state_version != self._local_state_version:
+                _LOGGER.debug("Local state changed during update, discarding fetched status")
+                return self.data
+
+            # Install the parse results together, back on the event loop
+            self._peripherals_by_zone = peripherals_by_zone
+            self._zone_index_map = zone_index_map
+            self._continuous_fan = parsed_data["main"]["fan_continuous"]
             self.last_data = parsed_data
-            _LOGGER.debug("Parsed data: %s", parsed_data)
+            self._last_status_digest = status_digest
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Parsed data - On: %s, Mode: %s, Fan: %s, Zones: %d",
+                    parsed_data["main"]["is_on"],
+                    parsed_data["main"]["mode"],
+                    parsed_data["main"]["fan_mode"],
+                    len(parsed_data["zones"]),
+                )
             return parsed_data
         except AuthenticationError as err:
             _LOGGER.error("Authentication error: %s", err)
@@ -83,101 +195,93 @@ class ActronDataCoordinator(DataUpdateCoordinator):
                 return self.last_data
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
-    def _parse_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _parse_data(
+        self, data: Dict[str, Any]
+    ) -> tuple[Dict[str, Any], Dict[int, Dict[str, Any]], Dict[str, int]]:
         """Parse the data from the API into a format suitable for the climate entity.
+
+        Runs in the executor, so it only builds and returns values; the caller
+        installs them on the coordinator from the event loop.
         
         Args:
             data: Raw API response data
             
         Returns:
-            Dict containing parsed data including raw data for diagnostics
+            Tuple of the parsed main and zone data, the peripheral index keyed
+            by zone number and the zone ID to zone index map
             
         Raises:
             UpdateFailed: If parsing fails
         """
         try:
             last_known_state = data.get("lastKnownState", {})
-            user_aircon_settings = last_known_state.get("UserAirconSettings", {})
-            master_info = last_known_state.get("MasterInfo", {})
-            live_aircon = last_known_state.get("LiveAircon", {})
             aircon_system = last_known_state.get("AirconSystem", {})
-            alerts = last_known_state.get("Alerts", {})
-            
+
             # Get fan mode and check for continuous state using '+CONT'
-            fan_mode = user_aircon_settings.get("FanMode", "")
-            is_continuous = fan_mode.endswith("+CONT")
+            fan_mode = _extract(last_known_state, ("UserAirconSettings", "FanMode"), "")
+            is_continuous = "+CONT" in fan_mode
 
             # Strip the continuous suffix for clean fan_mode storage
-            base_fan_mode = fan_mode.split('+')[0] if '+' in fan_mode else fan_mode
-            base_fan_mode = base_fan_mode.split('-')[0] if '-' in base_fan_mode else base_fan_mode
-
-            parsed_data = {
-                # Store raw data for diagnostics
-                "raw_data": data,
-                
-                "main": {
-                    "is_on": user_aircon_settings.get("isOn", False),
-                    "mode": user_aircon_settings.get("Mode", "OFF"),
-                    "fan_mode": fan_mode,  # Store complete fan mode string
-                    "fan_continuous": is_continuous,  # Explicit continuous state tracking
-                    "base_fan_mode": base_fan_mode,  # Store base fan mode without suffix
-                    "temp_setpoint_cool": user_aircon_settings.get("TemperatureSetpoint_Cool_oC"),
-                    "temp_setpoint_heat": user_aircon_settings.get("TemperatureSetpoint_Heat_oC"),
-                    "indoor_temp": master_info.get("LiveTemp_oC"),
-                    "indoor_humidity": master_info.get("LiveHumidity_pc"),
-                    "compressor_state": live_aircon.get("CompressorMode", "OFF"),
-                    "EnabledZones": user_aircon_settings.get("EnabledZones", []),
-                    "away_mode": user_aircon_settings.get("AwayMode", False),
-                    "quiet_mode": user_aircon_settings.get("QuietMode", False),
-                    "model": aircon_system.get("MasterWCModel"),
-                    "serial_number": aircon_system.get("MasterSerial"),
-                    "firmware_version": aircon_system.get("MasterWCFirmwareVersion"),
-                    # Add alert statuses
-                    "filter_clean_required": alerts.get("CleanFilter", False),
-                    "defrosting": alerts.get("Defrosting", False),
-                },
-                "zones": {}
-            }
-
-            # Update continuous fan state based on actual mode
-            self._continuous_fan = is_continuous
-            
-            _LOGGER.debug(
-                "Fan mode status - Raw: %s, Base: %s, Continuous: %s",
-                fan_mode,
-                base_fan_mode,
-                is_continuous
-            )
+            base_fan_mode = fan_mode.partition('+')[0].partition('-')[0]
+
+            main = {key: _extract(last_known_state, path, default) for key, path, default in _MAIN_FIELDS}
+            main["fan_mode"] = fan_mode  # Store complete fan mode string
+            main["fan_continuous"] = is_continuous  # Explicit continuous state tracking
+            main["base_fan_mode"] = base_fan_mode  # Store base fan mode without suffix
+            enabled_zones = main["EnabledZones"]
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Fan mode status - Raw: %s, Base: %s, Continuous: %s",
+                    fan_mode,
+                    base_fan_mode,
+                    is_continuous
+                )
 
             # Parse zone data with battery information
             remote_zone_info = last_known_state.get("RemoteZoneInfo", [])
             peripherals = aircon_system.get("Peripherals", [])
 
+            # Index peripherals assigned to a single zone by their 1-based zone
+            # number; the first peripheral listed for a zone wins
+            peripherals_by_zone = {}
+            for peripheral in peripherals:
+                zone_assignment = peripheral.get("ZoneAssignment")
+                if isinstance(zone_assignment, list) and len(zone_assignment) == 1:
+                    peripherals_by_zone.setdefault(zone_assignment[0], peripheral)
+
+            zone_index_map = {}
+            zone_items: list[tuple[str, Dict[str, Any]]] = []
             for i, zone in enumerate(remote_zone_info):
                 if i < MAX_ZONES and zone.get("NV_Exists", False):
                     zone_id = f"zone_{i+1}"
+                    zone_index_map[zone_id] = i
                     zone_data = {
                         "name": zone.get("NV_Title", f"Zone {i+1}"),
                         "temp": zone.get("LiveTemp_oC"),
                         "humidity": zone.get("LiveHumidity_pc"),
-                        "is_enabled": parsed_data["main"]["EnabledZones"][i] if i < len(parsed_data["main"]["EnabledZones"]) else False,
+                        "is_enabled": enabled_zones[i] if i < len(enabled_zones) else False,
                     }
 
-                    # Find matching peripheral for battery info
-                    for peripheral in peripherals:
-                        if peripheral.get("ZoneAssignment", []) == [i + 1]:
-                            zone_data.update({
-                                "battery_level": peripheral.get("RemainingBatteryCapacity_pc"),
-                                "signal_strength": peripheral.get("Signal_of3"),
-                                "peripheral_type": peripheral.get("DeviceType"),
-                                "last_connection": peripheral.get("LastConnectionTime"),
-                                "connection_state": peripheral.get("ConnectionState"),
-                            })
-                            break
+                    # Add battery info from the matching peripheral
+                    peripheral = peripherals_by_zone.get(i + 1)
+                    if peripheral:
+                        zone_data.update({
+                            "battery_level": peripheral.get("RemainingBatteryCapacity_pc"),
+                            "signal_strength": peripheral.get("Signal_of3"),
+                            "peripheral_type": peripheral.get("DeviceType"),
+                            "last_connection": peripheral.get("LastConnectionTime"),
+                            "connection_state": peripheral.get("ConnectionState"),
+                        })
 
-                    parsed_data["zones"][zone_id] = zone_data
+                    zone_items.append((zone_id, zone_data))
 
-            return parsed_data
+            # The raw payload is not kept here; diagnostics read api.cached_status
+            parsed_data = {
+                "main": main,
+                "zones": dict(zone_items),
+            }
+            return parsed_data, peripherals_by_zone, zone_index_map
 
         except Exception as e:
             _LOGGER.error("Failed to parse API response: %s", e, exc_info=True)
@@ -186,14 +290,10 @@ class ActronDataCoordinator(DataUpdateCoordinator):
     def get_zone_peripheral(self, zone_id: str) -> Union[Dict[str, Any], None]:
         """Get peripheral data for a specific zone."""
         try:
-            zone_index = int(zone_id.split('_')[1]) - 1
-            peripherals = self.data.get("raw_data", {}).get("AirconSystem", {}).get("Peripherals", [])
-
-            for peripheral in peripherals:
-                if peripheral.get("ZoneAssignment", []) == [zone_index + 1]:
-                    return peripheral
-
-            return None
+            zone_index = self._zone_index(zone_id)
+            if zone_index is None:
+                return None
+            return self._peripherals_by_zone.get(zone_index + 1)
         except (KeyError, ValueError, IndexError) as ex:
             _LOGGER.error("Error getting peripheral data for zone %s: %s", zone_id, str(ex))
             return None
@@ -215,7 +315,10 @@ class ActronDataCoordinator(DataUpdateCoordinator):
             else:
                 command = self.api.create_command("CLIMATE_MODE", mode=hvac_mode)
             await self.api.send_command(self.device_id, command)
-            await self.async_request_refresh()
+            if hvac_mode == HVACMode.OFF:
+                self._async_apply_local_state(is_on=False)
+            else:
+                self._async_apply_local_state(is_on=True, mode=hvac_mode)
         except Exception as err:
             _LOGGER.error("Failed to set HVAC mode to %s: %s", hvac_mode, err)
             raise
@@ -225,7 +328,8 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         try:
             command = self.api.create_command("SET_TEMP", temp=temperature, is_cool=is_cooling)
             await self.api.send_command(self.device_id, command)
-            await self.async_request_refresh()
+            setpoint_key = "temp_setpoint_cool" if is_cooling else "temp_setpoint_heat"
+            self._async_apply_local_state(**{setpoint_key: temperature})
         except Exception as err:
             _LOGGER.error("Failed to set %s temperature to %s: %s", 'cooling' if is_cooling else 'heating', temperature, err)
             raise
@@ -243,42 +347,36 @@ class ActronDataCoordinator(DataUpdateCoordinator):
         """
         try:
             # Validate mode before proceeding
-            valid_modes = ["LOW", "MED", "HIGH", "AUTO"]
             base_mode = mode.upper()
-            if base_mode not in valid_modes:
+            if base_mode not in VALID_FAN_MODES:
                 _LOGGER.warning("Invalid fan mode %s, defaulting to LOW", mode)
                 base_mode = "LOW"
                 
             # If continuous is not specified, maintain current state from coordinator data
             if continuous is None:
-                current_mode = self.data["main"].get("fan_mode", "")
-                continuous = current_mode.endswith("+CONT")
+                continuous = self.data["main"].get("fan_continuous", self._continuous_fan)
                 _LOGGER.debug("Maintaining current continuous state: %s", continuous)
 
             # Log the intended change
-            _LOGGER.debug(
-                "Setting fan mode - Base: %s, Continuous: %s (Current: %s)", 
-                base_mode,
-                continuous,
-                self.data["main"].get("fan_mode")
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Setting fan mode - Base: %s, Continuous: %s (Current: %s)",
+                    base_mode,
+                    continuous,
+                    self.data["main"].get("fan_mode")
+                )
 
             # Send command to API
             await self.api.set_fan_mode(base_mode, continuous)
             
             # Update local state tracking
             self._continuous_fan = continuous
-            
-            # Force immediate refresh to update UI state
-            await self.async_request_refresh()
-            
-            # Verify the change was successful
-            new_mode = self.data["main"].get("fan_mode", "")
-            _LOGGER.debug("New fan mode after update: %s", new_mode)
-            
-            if continuous and not new_mode.endswith("+CONT"):
-                _LOGGER.warning("Continuous mode may not have been set correctly")
-                
+            self._async_apply_local_state(
+                fan_mode=f"{base_mode}+CONT" if continuous else base_mode,
+                fan_continuous=continuous,
+                base_fan_mode=base_mode,
+            )
+
         except ApiError as err:
             _LOGGER.error(
                 "API error setting fan mode %s (continuous=%s): %s", 
@@ -302,13 +400,9 @@ class ActronDataCoordinator(DataUpdateCoordinator):
             temp_key: Temperature key for heating or cooling
             
         Raises:
-            ValueError: If zone control is disabled or validation fails
+            ValueError: If validation fails
             ApiError: If API communication fails
         """
-        if not self.enable_zone_control:
-            _LOGGER.error("Attempted to set zone temperature while zone control is disabled")
-            raise ValueError("Zone control is not enabled")
-
         if not self.last_data:
             _LOGGER.error("No data available for zone temperature control")
             raise ValueError("No system data available")
@@ -325,7 +419,9 @@ class ActronDataCoordinator(DataUpdateCoordinator):
             raise ValueError(f"Zone {zone_id} is not enabled")
 
         try:
-            zone_index = int(zone_id.split('_')[1]) - 1
+            zone_index = self._zone_index(zone_id)
+            if zone_index is None:
+                raise ValueError(f"Zone {zone_id} not found")
             command = self.api.create_command("SET_ZONE_TEMP",
                                         zone=zone_index,
                                         temp=temperature,
@@ -339,42 +435,67 @@ class ActronDataCoordinator(DataUpdateCoordinator):
 
     async def set_zone_state(self, zone_id: Union[str, int], enable: bool) -> None:
         """Set zone state.
+
+        Changes requested within ZONE_STATE_BATCH_DELAY of each other are sent
+        together as a single SET_ZONE_STATE command.
+
         Args:
             zone_id: Either a zone ID string (e.g. 'zone_1') or direct zone index (0-7)
             enable: True to enable zone, False to disable
         """
         try:
-            # Handle both string zone_id and direct integer index
-            if isinstance(zone_id, str):
-                zone_index = int(zone_id.split('_')[1]) - 1
-            else:
-                zone_index = int(zone_id)  # Direct index from switch component
-
-            current_zone_status = self.last_data["main"]["EnabledZones"]
-            modified_statuses = current_zone_status.copy()
+            # Handle both string zone_id and direct integer index from switch component
+            zone_index = self._zone_index(zone_id)
+            if zone_index is None:
+                raise ValueError(f"Zone {zone_id} not found")
 
             # Ensure zone_index is within bounds
-            if 0 <= zone_index < len(modified_statuses):
-                modified_statuses[zone_index] = enable
-                command = self.api.create_command("SET_ZONE_STATE", zones=modified_statuses)
-                await self.api.send_command(self.device_id, command)
-                await self.async_request_refresh()
-            else:
+            if not 0 <= zone_index < len(self.last_data["main"]["EnabledZones"]):
                 raise ValueError(f"Zone index {zone_index} out of range")
 
+            self._pending_zones[zone_index] = enable
+            if self._zone_flush_task is None:
+                self._zone_flush_task = self.hass.async_create_task(self._flush_zone_states())
+                self._zone_flush_task.add_done_callback(self._zone_flush_done)
+            flush_task = self._zone_flush_task
+
+            # Shield so a cancelled caller does not drop the other queued changes
+            await asyncio.shield(flush_task)
+
         except Exception as err:
             _LOGGER.error("Failed to set zone %s state to %s: %s", zone_id, 'on' if enable else 'off', err)
             raise
 
-    async def set_climate_mode(self, mode: str) -> None:
-        """Set climate mode for all zones."""
-        try:
-            command = self.api.create_command("CLIMATE_MODE", mode=mode)
+    async def _flush_zone_states(self) -> None:
+        """Send all zone state changes queued during the batch window.
+
+        Flushes run one at a time, so each batch starts from the zone states
+        applied by the previous one rather than from a stale snapshot.
+        """
+        await asyncio.sleep(ZONE_STATE_BATCH_DELAY)
+        async with self._zone_flush_lock:
+            pending = self._pending_zones
+            self._pending_zones = {}
+            self._zone_flush_task = None
+
+            modified_statuses = list(self.last_data["main"]["EnabledZones"])
+            for zone_index, enable in pending.items():
+                modified_statuses[zone_index] = enable
+
+            command = self.api.create_command("SET_ZONE_STATE", zones=modified_statuses)
             await self.api.send_command(self.device_id, command)
-            await self.async_request_refresh()
-        except Exception as err:
-            _LOGGER.error("Failed to set climate mode to %s: %s", mode, err)
-            raise
+
+            for zone_index, enable in pending.items():
+                zone_data = self.data["zones"].get(f"zone_{zone_index + 1}")
+                if zone_data:
+                    zone_data["is_enabled"] = enable
+            self._async_apply_local_state(EnabledZones=modified_statuses)
+
+    @staticmethod
+    def _zone_flush_done(task: asyncio.Task) -> None:
+        """Retrieve a flush failure in case every waiting caller was cancelled."""
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.debug("Zone state flush failed: %s", task.exception())
 
     async def set_away_mode(self, state: bool) -> None:
         """Set away mode."""
@@ -397,3 +518,17 @@ class ActronDataCoordinator(DataUpdateCoordinator):
     async def force_update(self) -> None:
         """Force an immediate update of the device data."""
         await self.async_refresh()
+
+class _ActronDataCoordinatorNoZoneControl(ActronDataCoordinator):
+    """Coordinator variant used while zone control is disabled.
+
+    Zone data is still parsed for the zone sensors and switches; only zone
+    temperature control is unavailable.
+    """
+
+    __slots__ = ()
+
+    async def set_zone_temperature(self, zone_id: str, temperature: float, temp_key: str) -> None:
+        """Reject zone temperature changes while zone control is disabled."""
+        _LOGGER.error("Attempted to set zone temperature while zone control is disabled")
+        raise ValueError("Zone control is not enabled")
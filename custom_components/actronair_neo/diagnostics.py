@@ -29,8 +29,8 @@ async def async_get_config_entry_diagnostics(
         if not coordinator or not coordinator.data:
             raise ValueError("No coordinator data available")
 
-        # First get the correct path to the data
-        raw_data = coordinator.data.get("raw_data", {})
+        # The raw payload is only retained by the API's status cache
+        raw_data = coordinator.api.cached_status or {}
         # Use device serial to access the correct data
         device_serial = coordinator.data["main"]["serial_number"]
         last_known_state = raw_data.get("lastKnownState", {}).get(f"<{device_serial.upper()}>", {})
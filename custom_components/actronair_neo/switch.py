@@ -2,7 +2,6 @@
 from __future__ import annotations
 import datetime
 import logging
-import asyncio
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity # type: ignore
@@ -11,7 +10,7 @@ from homeassistant.core import HomeAssistant # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback # type: ignore
 from homeassistant.helpers.update_coordinator import CoordinatorEntity # type: ignore
 
-from .const import DOMAIN, ICON_ZONE
+from .const import DOMAIN, ICON_ZONE, VALID_FAN_MODES
 from .coordinator import ActronDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -120,8 +119,7 @@ class ActronContinuousFanSwitch(ActronBaseSwitch):
             fan_mode = self.coordinator.data["main"].get("base_fan_mode", "LOW")
             
             # Validate base mode
-            valid_modes = ["LOW", "MED", "HIGH", "AUTO"]
-            if fan_mode not in valid_modes:
+            if fan_mode not in VALID_FAN_MODES:
                 _LOGGER.warning("Invalid base fan mode %s, defaulting to LOW", fan_mode)
                 fan_mode = "LOW"
                 
@@ -129,13 +127,6 @@ class ActronContinuousFanSwitch(ActronBaseSwitch):
             
             # Set fan mode with continuous enabled
             await self.coordinator.set_fan_mode(fan_mode, True)
-            
-            # Request refresh to update state
-            await asyncio.sleep(1)  # Short delay for API processing
-            await self.coordinator.async_request_refresh()
-            
-            if not self.coordinator.data["main"].get("fan_continuous"):
-                _LOGGER.warning("Continuous mode did not activate as expected")
                 
         except Exception as err:
             _LOGGER.error(
@@ -152,8 +143,7 @@ class ActronContinuousFanSwitch(ActronBaseSwitch):
             fan_mode = self.coordinator.data["main"].get("base_fan_mode", "LOW")
             
             # Validate base mode
-            valid_modes = ["LOW", "MED", "HIGH", "AUTO"]
-            if fan_mode not in valid_modes:
+            if fan_mode not in VALID_FAN_MODES:
                 _LOGGER.warning("Invalid base fan mode %s, defaulting to LOW", fan_mode)
                 fan_mode = "LOW"
                 
@@ -161,13 +151,6 @@ class ActronContinuousFanSwitch(ActronBaseSwitch):
             
             # Set fan mode with continuous disabled
             await self.coordinator.set_fan_mode(fan_mode, False)
-            
-            # Request refresh to update state
-            await asyncio.sleep(1)  # Short delay for API processing
-            await self.coordinator.async_request_refresh()
-            
-            if self.coordinator.data["main"].get("fan_continuous"):
-                _LOGGER.warning("Continuous mode did not deactivate as expected")
                 
         except Exception as err:
             _LOGGER.error(